@@ -17,7 +17,7 @@ from ..config import get_settings
 from ..models import Model, ConfigKV
 from ..docker_manager import start_container_for_model, stop_container_for_model, tail_logs_for_model, OfflineImageUnavailableError
 from ..services.registry_persistence import persist_model_registry
-from ..services.model_testing import ModelTestResult, ReadinessResp, test_chat_model, test_embedding_model, check_model_readiness
+from ..services.model_testing import ModelTestResult, ReadinessResp, test_chat_model, test_embedding_model, check_model_readiness, invalidate_readiness, now_ms
 from ..services.folder_inspector import inspect_model_folder
 from ..services.hf_inspector import fetch_hf_config
 from ..schemas.models import ModelItem, CreateModelRequest, UpdateModelRequest, BaseDirCfg, InspectFolderResp, HfConfigResp
@@ -623,6 +623,8 @@ async def start_model(model_id: int, _: dict = Depends(require_admin)):
                 await session.commit()
             
             name, host_port = start_container_for_model(m, hf_token=getattr(m, 'hf_token', None))
+            if m.served_model_name:
+                invalidate_readiness(name, m.served_model_name, host_port)
             # Initially set to "loading" state - we'll verify actual health below
             await session.execute(update(Model).where(Model.id == model_id).values(state="loading", container_name=name, port=host_port))
             await session.commit()
@@ -771,6 +773,8 @@ async def stop_model(model_id: int, _: dict = Depends(require_admin)):
             stop_container_for_model(m)
         except Exception:
             pass
+        if m.container_name and m.served_model_name:
+            invalidate_readiness(m.container_name, m.served_model_name, m.port)
         await session.execute(update(Model).where(Model.id == model_id).values(state="stopped"))
         try:
             if m.served_model_name:
@@ -847,6 +851,8 @@ async def apply_model_changes(model_id: int, _: dict = Depends(require_admin)):
         except Exception:
             pass
         name, host_port = start_container_for_model(m, hf_token=getattr(m, 'hf_token', None))
+        if m.served_model_name:
+            invalidate_readiness(name, m.served_model_name, host_port)
         await session.execute(update(Model).where(Model.id == model_id).values(state="running", container_name=name, port=host_port))
         await session.commit()
         try:
@@ -1037,7 +1043,7 @@ async def test_model(model_id: int, _: dict = Depends(require_admin)):
         # Determine test type from task field
         test_type = "embeddings" if m.task and m.task.lower().startswith("embed") else "chat"
         
-        start_time = time.time()
+        start_ms = now_ms()
         result_data = {}
         
         try:
@@ -1047,7 +1053,7 @@ async def test_model(model_id: int, _: dict = Depends(require_admin)):
             else:
                 result_data = await test_chat_model(base_url, m.served_model_name, settings.INTERNAL_VLLM_API_KEY)
             
-            latency_ms = int((time.time() - start_time) * 1000)
+            latency_ms = now_ms() - start_ms
             
             return ModelTestResult(
                 success=True,
@@ -1060,7 +1066,7 @@ async def test_model(model_id: int, _: dict = Depends(require_admin)):
             )
             
         except Exception as e:
-            latency_ms = int((time.time() - start_time) * 1000)
+            latency_ms = now_ms() - start_ms
             return ModelTestResult(
                 success=False,
                 test_type=test_type,
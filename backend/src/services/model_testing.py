@@ -1,12 +1,74 @@
 """Model testing and readiness checking utilities."""
 
+import asyncio
+import json
+import re
+import socket
 import httpx
 import time
-from typing import Any, Dict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Final
 from pydantic import BaseModel, Field
 from typing import Optional
 
 
+# Request timeouts, shared across calls so they are tuned in one place
+# Test requests allow up to 2 minutes for large models
+_CHAT_TIMEOUT: Final = httpx.Timeout(connect=5.0, read=120.0, write=10.0, pool=5.0)
+_EMBED_TIMEOUT: Final = httpx.Timeout(connect=5.0, read=10.0, write=10.0, pool=5.0)
+_HEALTH_TIMEOUT: Final = httpx.Timeout(connect=3.0, read=5.0, write=3.0, pool=5.0)
+_MODELS_TIMEOUT: Final = httpx.Timeout(connect=3.0, read=5.0, write=3.0, pool=5.0)
+# Large models (30B+) may take 10+ seconds for first token
+_READY_CHAT_TIMEOUT: Final = httpx.Timeout(connect=5.0, read=30.0, write=5.0, pool=10.0)
+
+# Minimal readiness chat request; only the (JSON-encoded) model name varies.
+# Streamed so the server flushes the single token as soon as it is generated.
+_READY_CHAT_BODY_FMT: Final = b'{"model":%s,"messages":[{"role":"user","content":"Hi"}],"max_tokens":1,"temperature":0.0,"stream":true}'
+
+# Loading markers in 503 error bodies (matched on raw bytes, case-insensitive)
+_LOADING_RE: Final = re.compile(rb"loading|initializing", re.IGNORECASE)
+
+# Container name -> (resolved_at, ip or None). Misses are cached too so that
+# host-network gateways don't pay a failing DNS lookup on every readiness poll,
+# but only briefly: Docker drops a container's name while it is down.
+_DNS_TTL_SEC = 300.0
+_DNS_NEGATIVE_TTL_SEC = 10.0
+_dns_cache: dict[str, tuple[float, Optional[str]]] = {}
+
+# (container_name, served_model_name) -> (checked_at, result). The UI polls far
+# more often than model state changes, so recent results are reused briefly.
+_READINESS_TTL_SEC = {"ready": 2.0, "loading": 0.5, "error": 1.0}
+_readiness_cache: dict[tuple[str, str], tuple[float, "ReadinessResp"]] = {}
+# Max concurrent model probes in check_many_readiness()
+_READINESS_CONCURRENCY = 16
+
+# base_url -> HTTP method for /health. HEAD avoids transferring the body; servers
+# that reject it with 405 are remembered and probed with GET from then on.
+_health_method_cache: dict[str, str] = {}
+
+# base_url -> monotonic deadline. After a refused connection nothing is listening
+# yet, so skip probing that server for a short grace window.
+_CONNECT_BACKOFF_SEC = 2.0
+_connect_fail_until: dict[str, float] = {}
+
+# base_url -> EWMA of Phase 3 chat probe latency (seconds), used to size that
+# probe's read timeout: fast models fail fast, slow ones get up to the full 30s.
+_LATENCY_EWMA_ALPHA = 0.2
+# Prior the first sample is blended into, so one fast response can't pin the
+# read timeout at the floor straight away
+_LATENCY_PRIOR_SEC = 5.0
+_latency_ewma: dict[str, float] = {}
+
+
+def now_ms() -> int:
+    """Monotonic clock in milliseconds for measuring elapsed time.
+    
+    Unaffected by wall-clock (NTP) adjustments; use time.time() only for
+    reported timestamps such as ModelTestResult.timestamp.
+    """
+    return int(time.monotonic() * 1000)
+
+
 class ModelTestResult(BaseModel):
     success: bool
     test_type: str
@@ -17,7 +79,10 @@ class ModelTestResult(BaseModel):
     timestamp: float
 
 
-class ReadinessResp(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ReadinessResp:
+    # Plain dataclass: built on every readiness poll and shared via the cache.
+    # FastAPI serializes it directly when used as a response_model.
     status: str  # 'ready' | 'loading' | 'stopped' | 'error'
     detail: Optional[str] = None
 
@@ -38,6 +103,17 @@ async def test_chat_model(base_url: str, model_name: str, internal_key: str = ""
     """
     from ..main import http_client  # type: ignore
     
+    # The chat-template fallback re-posts to the same server, so both requests
+    # must share a keep-alive pool. The app-wide client provides one; outside
+    # the app lifespan it is unset, so scope a small client to this test.
+    if http_client is None:
+        async with httpx.AsyncClient(limits=httpx.Limits(max_keepalive_connections=2)) as client:
+            return await _run_chat_test(client, base_url, model_name, internal_key)
+    return await _run_chat_test(http_client, base_url, model_name, internal_key)
+
+
+async def _run_chat_test(http_client: httpx.AsyncClient, base_url: str, model_name: str, internal_key: str) -> Dict[str, Any]:
+    """Chat test body for test_chat_model(), run against the given client."""
     request_data = {
         "model": model_name,
         "messages": [{"role": "user", "content": "Hello"}],
@@ -45,74 +121,73 @@ async def test_chat_model(base_url: str, model_name: str, internal_key: str = ""
         "temperature": 0.7
     }
     
+    # Serialize once up front; headers already carry the JSON content type
+    body = json.dumps(request_data).encode()
+    
     headers = {"Content-Type": "application/json"}
     if internal_key:
         headers["Authorization"] = f"Bearer {internal_key}"
     
     response = await http_client.post(
         f"{base_url}/v1/chat/completions",
-        json=request_data,
+        content=body,
         headers=headers,
-        timeout=httpx.Timeout(connect=5.0, read=120.0, write=10.0, pool=5.0)  # Increased to 2 minutes for large models
+        timeout=_CHAT_TIMEOUT,
     )
     
     # Fallback: if chat fails due to missing chat template, retry via completions
     # (transformers v4.44+ requires chat templates; some models don't have them)
     if response.status_code >= 400:
-        try:
-            err = response.json()
-            msg = str(err.get("message") or err.get("error") or "").lower()
+        # Cheap check on the raw error body; no need to parse JSON here
+        raw = response.content
+        if b"chat template" in raw.lower() or b"chat_template" in raw:
+            # Convert messages to prompt and try /v1/completions
+            messages = request_data.get("messages", [])
+            prompt = "\n\n".join([
+                f"{m.get('role', 'user').title()}: {m.get('content', '')}" 
+                for m in messages
+            ]) + "\n\nAssistant:"
             
-            if "chat template" in msg:
-                # Convert messages to prompt and try /v1/completions
-                messages = request_data.get("messages", [])
-                prompt = "\n\n".join([
-                    f"{m.get('role', 'user').title()}: {m.get('content', '')}" 
-                    for m in messages
-                ]) + "\n\nAssistant:"
-                
-                comp_request = {
-                    "model": model_name,
-                    "prompt": prompt,
-                    "max_tokens": request_data.get("max_tokens", 50),
-                    "temperature": request_data.get("temperature", 0.7),
-                }
-                
-                comp_response = await http_client.post(
-                    f"{base_url}/v1/completions",
-                    json=comp_request,
-                    headers=headers,
-                    timeout=httpx.Timeout(connect=5.0, read=120.0, write=10.0, pool=5.0)  # Increased to 2 minutes
-                )
-                
-                if comp_response.status_code >= 400:
-                    raise Exception(f"Model returned HTTP {comp_response.status_code}: {comp_response.text[:200]}")
-                
-                comp_data = comp_response.json()
-                
-                # Convert completions response to chat format for consistency
-                response_data = {
-                    "id": comp_data.get("id"),
-                    "object": "chat.completion",
-                    "created": comp_data.get("created"),
-                    "model": comp_data.get("model", model_name),
-                    "choices": [{
-                        "index": 0,
-                        "message": {
-                            "role": "assistant",
-                            "content": comp_data.get("choices", [{}])[0].get("text", "")
-                        },
-                        "finish_reason": comp_data.get("choices", [{}])[0].get("finish_reason")
-                    }],
-                    "usage": comp_data.get("usage")
-                }
-                
-                return {
-                    "request": request_data,
-                    "response": response_data
-                }
-        except Exception:
-            pass
+            comp_request = {
+                "model": model_name,
+                "prompt": prompt,
+                "max_tokens": request_data.get("max_tokens", 50),
+                "temperature": request_data.get("temperature", 0.7),
+            }
+            
+            comp_response = await http_client.post(
+                f"{base_url}/v1/completions",
+                content=json.dumps(comp_request).encode(),
+                headers=headers,
+                timeout=_CHAT_TIMEOUT,
+            )
+            
+            if comp_response.status_code >= 400:
+                raise Exception(f"Model returned HTTP {comp_response.status_code}: {comp_response.text[:200]}")
+            
+            comp_data = comp_response.json()
+            
+            # Convert completions response to chat format for consistency
+            response_data = {
+                "id": comp_data.get("id"),
+                "object": "chat.completion",
+                "created": comp_data.get("created"),
+                "model": comp_data.get("model", model_name),
+                "choices": [{
+                    "index": 0,
+                    "message": {
+                        "role": "assistant",
+                        "content": comp_data.get("choices", [{}])[0].get("text", "")
+                    },
+                    "finish_reason": comp_data.get("choices", [{}])[0].get("finish_reason")
+                }],
+                "usage": comp_data.get("usage")
+            }
+            
+            return {
+                "request": request_data,
+                "response": response_data
+            }
         
         # No fallback worked, raise original error
         raise Exception(f"Model returned HTTP {response.status_code}: {response.text[:200]}")
@@ -158,7 +233,7 @@ async def test_embedding_model(base_url: str, model_name: str, internal_key: str
         f"{base_url}/v1/embeddings",
         json=request_data,
         headers=headers,
-        timeout=httpx.Timeout(connect=5.0, read=10.0, write=10.0, pool=5.0)
+        timeout=_EMBED_TIMEOUT,
     )
     
     if response.status_code >= 400:
@@ -179,11 +254,210 @@ async def test_embedding_model(base_url: str, model_name: str, internal_key: str
     }
 
 
+def invalidate_readiness(container_name: str, served_model_name: str, host_port: int | None = None) -> None:
+    """Drop cached readiness, DNS and connect-backoff state for a model.
+    
+    Called when a model is started or stopped so the next check probes the
+    new container instead of reporting the previous one's state.
+    """
+    _readiness_cache.pop((container_name, served_model_name), None)
+    _dns_cache.pop(container_name, None)
+    # Either URL _probe_readiness may have used (bridge or host network)
+    _connect_fail_until.pop(f"http://{container_name}:8000", None)
+    _connect_fail_until.pop(f"http://127.0.0.1:{host_port or 8000}", None)
+
+
+async def _resolve_container(name: str) -> Optional[str]:
+    """Resolve a container name without blocking the event loop.
+    
+    Returns the IPv4 address, or None if the name doesn't resolve. Hits are
+    cached for _DNS_TTL_SEC, misses for _DNS_NEGATIVE_TTL_SEC.
+    """
+    now = time.monotonic()
+    cached = _dns_cache.get(name)
+    if cached is not None:
+        resolved_at, addr = cached
+        ttl = _DNS_TTL_SEC if addr is not None else _DNS_NEGATIVE_TTL_SEC
+        if now - resolved_at < ttl:
+            return addr
+    
+    try:
+        infos = await asyncio.get_running_loop().getaddrinfo(name, None, family=socket.AF_INET)
+        addr = infos[0][4][0] if infos else None
+    except socket.gaierror:
+        addr = None
+    
+    _dns_cache[name] = (now, addr)
+    return addr
+
+
+def _connection_refused(base_url: str) -> ReadinessResp:
+    """Record a refused connection to base_url and report the model as loading."""
+    _connect_fail_until[base_url] = time.monotonic() + _CONNECT_BACKOFF_SEC
+    return ReadinessResp(status="loading", detail="connection_refused")
+
+
+def _record_latency(base_url: str, elapsed: float) -> None:
+    """Fold a probe latency sample into the per-server EWMA."""
+    prev = _latency_ewma.get(base_url, _LATENCY_PRIOR_SEC)
+    _latency_ewma[base_url] = (1 - _LATENCY_EWMA_ALPHA) * prev + _LATENCY_EWMA_ALPHA * elapsed
+
+
+def _ready_chat_timeout(base_url: str) -> httpx.Timeout:
+    """Phase 3 timeout: read is 4x the observed latency, clamped to [5s, 30s]."""
+    ewma = _latency_ewma.get(base_url)
+    if ewma is None:
+        return _READY_CHAT_TIMEOUT
+    read = max(5.0, min(_READY_CHAT_TIMEOUT.read, 4.0 * ewma))
+    return httpx.Timeout(
+        connect=_READY_CHAT_TIMEOUT.connect,
+        read=read,
+        write=_READY_CHAT_TIMEOUT.write,
+        pool=_READY_CHAT_TIMEOUT.pool,
+    )
+
+
+def _parse_err(body: bytes) -> str:
+    """Extract the error message from a model server error body.
+    
+    Handles OpenAI-style {"error": {"message": ...}} as well as flat
+    {"detail"|"error"|"message": ...} bodies; non-JSON bodies are returned
+    as (truncated) text.
+    """
+    try:
+        j = json.loads(body)
+        err = j.get("error")
+        if isinstance(err, dict):
+            return str(err.get("message") or "")
+        return str(j.get("detail") or err or j.get("message") or "")
+    except (ValueError, AttributeError):
+        return body[:200].decode("utf-8", errors="replace")
+
+
+async def _fetch_health(http_client: httpx.AsyncClient, base_url: str) -> httpx.Response:
+    """Request /health, preferring HEAD and falling back to GET once on 405."""
+    url = f"{base_url}/health"
+    if _health_method_cache.get(base_url) != "GET":
+        resp = await http_client.head(url, timeout=_HEALTH_TIMEOUT)
+        if resp.status_code != 405:
+            return resp
+        _health_method_cache[base_url] = "GET"
+    return await http_client.get(url, timeout=_HEALTH_TIMEOUT)
+
+
+async def _probe(
+    send: Callable[[], Awaitable[httpx.Response]], base_url: str, timeout_detail: str
+) -> tuple[Optional[httpx.Response], Optional[ReadinessResp], bool]:
+    """Send a probe request, mapping timeouts and refused connections.
+    
+    The request is built inside the probe (send is called here), so wrapping
+    a probe in a task never fails or leaves an un-awaited coroutine behind.
+    
+    Returns (response, None, False) on success, or (None, early, timed_out)
+    where early is the ReadinessResp to report: loading/<timeout_detail> on
+    timeout (server may still be starting) or loading/connection_refused
+    (server not up yet).
+    """
+    try:
+        return await send(), None, False
+    except httpx.TimeoutException:
+        return None, ReadinessResp(status="loading", detail=timeout_detail), True
+    except httpx.ConnectError:
+        return None, _connection_refused(base_url), False
+
+
+async def _post_ready_chat(
+    http_client: httpx.AsyncClient, base_url: str, served_model_name: str, api_key: str
+) -> httpx.Response:
+    """Send the Phase 3 chat probe, returning once the stream ends.
+    
+    With max_tokens=1 the stream ends right after the first token, so it is
+    drained rather than abandoned: httpx's byte iterators are nested async
+    generators that an early break leaves suspended until loop finalization.
+    """
+    body = _READY_CHAT_BODY_FMT % json.dumps(served_model_name).encode()
+    async with http_client.stream(
+        "POST",
+        f"{base_url}/v1/chat/completions",
+        content=body,
+        headers={
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {api_key}",
+        },
+        timeout=_ready_chat_timeout(base_url),
+    ) as resp:
+        await resp.aread()
+    return resp
+
+
+def _health_verdict(task: asyncio.Task) -> Optional[ReadinessResp]:
+    """Interpret a finished /health probe. Returns None if inconclusive."""
+    try:
+        health_resp, early, _ = task.result()
+    except httpx.HTTPError:
+        # Other transport/protocol failure - fall through to the other checks
+        return None
+    if early is not None:
+        return early
+    
+    if health_resp.status_code == 200:
+        # Model is healthy and ready to serve
+        return ReadinessResp(status="ready")
+    
+    if health_resp.status_code == 503:
+        # Server is up but model not ready yet (vLLM loading state)
+        if _LOADING_RE.search(health_resp.content):
+            return ReadinessResp(status="loading", detail="model_loading")
+        msg = _parse_err(health_resp.content)
+        # HEAD responses carry no body to report
+        return ReadinessResp(status="loading", detail=f"health_503: {msg[:100]}" if msg else "health_503")
+    
+    return None
+
+
+def _models_verdict(task: asyncio.Task, served_model_name: str) -> Optional[ReadinessResp]:
+    """Interpret a finished /v1/models probe. Returns None if inconclusive."""
+    try:
+        models_resp, early, _ = task.result()
+    except httpx.HTTPError:
+        return None
+    if early is not None:
+        return early
+    
+    if models_resp.status_code == 200:
+        try:
+            data = models_resp.json()
+            models = data.get("data", [])
+            # Check if our model is in the list
+            model_ids = {m.get("id") for m in models}
+            if served_model_name in model_ids:
+                return ReadinessResp(status="ready")
+            # Model not found in list but endpoint works - might still be loading
+            if not models:
+                return ReadinessResp(status="loading", detail="models_list_empty")
+            # Server lists other models but not ours - not serving it yet
+            return ReadinessResp(status="loading", detail="model_not_registered")
+        except (ValueError, AttributeError, TypeError):
+            # Not JSON, or not the expected {"data": [{"id": ...}]} shape
+            pass
+        # Models endpoint works, assume ready
+        return ReadinessResp(status="ready")
+    
+    if models_resp.status_code == 503:
+        if _LOADING_RE.search(models_resp.content):
+            return ReadinessResp(status="loading", detail="loading_model")
+        msg = _parse_err(models_resp.content)
+        return ReadinessResp(status="loading", detail=f"503: {msg[:100]}")
+    
+    return None
+
+
 async def check_model_readiness(container_name: str, served_model_name: str, host_port: int | None = None) -> ReadinessResp:
     """Check if a model is ready to serve requests.
     
     Uses a two-phase approach:
-    1. First check the /health endpoint (fast, lightweight) - if 200, model is ready
+    1. Check the /health and /v1/models endpoints concurrently (fast, lightweight) -
+       if /health returns 200, model is ready
     2. For llama.cpp with 503 "Loading model", report as loading
     
     This avoids the timeout issues with chat completion checks on large models,
@@ -191,6 +465,9 @@ async def check_model_readiness(container_name: str, served_model_name: str, hos
     
     Handles both Docker bridge network (container name) and host network (localhost:port).
     
+    Results are cached briefly per model (see _READINESS_TTL_SEC); call
+    invalidate_readiness() when a model is started or stopped.
+    
     Args:
         container_name: Docker container name
         served_model_name: Model's served name
@@ -199,12 +476,42 @@ async def check_model_readiness(container_name: str, served_model_name: str, hos
     Returns:
         ReadinessResp with status and optional detail
     """
+    key = (container_name, served_model_name)
+    cached = _readiness_cache.get(key)
+    if cached is not None:
+        checked_at, resp = cached
+        if time.monotonic() - checked_at < _READINESS_TTL_SEC.get(resp.status, 1.0):
+            return resp
+    
+    result = await _probe_readiness(container_name, served_model_name, host_port)
+    _readiness_cache[key] = (time.monotonic(), result)
+    return result
+
+
+async def check_many_readiness(models: list[tuple[str, str, int | None]]) -> list[ReadinessResp]:
+    """Check readiness of several models concurrently.
+    
+    Args:
+        models: (container_name, served_model_name, host_port) per model
+        
+    Returns:
+        ReadinessResp per model, in the same order as the input
+    """
+    sem = asyncio.Semaphore(_READINESS_CONCURRENCY)
+    
+    async def _one(container_name: str, served_model_name: str, host_port: int | None) -> ReadinessResp:
+        async with sem:
+            return await check_model_readiness(container_name, served_model_name, host_port)
+    
+    return await asyncio.gather(*(_one(*m) for m in models))
+
+
+async def _probe_readiness(container_name: str, served_model_name: str, host_port: int | None) -> ReadinessResp:
+    """Run the readiness phases against the model server (uncached)."""
     # Determine base URL: try container name first, fall back to localhost if needed
-    import socket
-    try:
-        socket.gethostbyname(container_name)
+    if await _resolve_container(container_name):
         base_url = f"http://{container_name}:8000"
-    except socket.gaierror:
+    else:
         # Container name doesn't resolve - gateway is on host network
         if host_port:
             base_url = f"http://127.0.0.1:{host_port}"
@@ -212,118 +519,85 @@ async def check_model_readiness(container_name: str, served_model_name: str, hos
             # Try common localhost as last resort
             base_url = f"http://127.0.0.1:8000"
     
+    # Recently refused the connection - don't pay connect timeouts again yet
+    if time.monotonic() < _connect_fail_until.get(base_url, 0.0):
+        return ReadinessResp(status="loading", detail="connection_refused")
+    
     try:
         from ..main import http_client  # type: ignore
         from ..config import get_settings
         settings = get_settings()
         api_key = settings.INTERNAL_VLLM_API_KEY or "dev-internal-token"
         
-        # Phase 1: Check health endpoint first (fast and reliable)
-        # Both vLLM and llama.cpp expose /health that returns 200 when ready
+        # Phase 1 + 2: Probe /health and /v1/models concurrently
+        # /health is fast and authoritative on both vLLM and llama.cpp; /v1/models
+        # additionally verifies the model is registered and serving.
+        tasks: list[asyncio.Task] = []
         try:
-            health_resp = await http_client.get(
-                f"{base_url}/health",
-                timeout=httpx.Timeout(connect=3.0, read=5.0, write=3.0, pool=5.0),
-            )
+            health_task = asyncio.create_task(_probe(
+                lambda: _fetch_health(http_client, base_url), base_url, "health_timeout"
+            ))
+            tasks.append(health_task)
+            models_task = asyncio.create_task(_probe(
+                lambda: http_client.get(
+                    f"{base_url}/v1/models",
+                    headers={"Authorization": f"Bearer {api_key}"},
+                    timeout=_MODELS_TIMEOUT,
+                ),
+                base_url,
+                "models_timeout",
+            ))
+            tasks.append(models_task)
             
-            if health_resp.status_code == 200:
-                # Model is healthy and ready to serve
-                return ReadinessResp(status="ready")
-            
-            if health_resp.status_code == 503:
-                # Server is up but model not ready yet (vLLM loading state)
-                try:
-                    j = health_resp.json()
-                    msg = str(j.get("detail") or j.get("error") or j.get("message") or "")
-                except Exception:
-                    msg = health_resp.text[:200]
-                
-                if "loading" in msg.lower() or "initializing" in msg.lower():
-                    return ReadinessResp(status="loading", detail="model_loading")
-                return ReadinessResp(status="loading", detail=f"health_503: {msg[:100]}")
-                
-        except httpx.TimeoutException:
-            # Health check timed out - server may still be starting
-            return ReadinessResp(status="loading", detail="health_timeout")
-        except httpx.ConnectError:
-            # Can't connect - server not up yet
-            return ReadinessResp(status="loading", detail="connection_refused")
-        except Exception as health_err:
-            # Log but continue to chat check as fallback
-            pass
+            done, _ = await asyncio.wait({health_task, models_task}, return_when=asyncio.FIRST_COMPLETED)
+            if health_task in done:
+                verdict = _health_verdict(health_task)
+                if verdict is not None:
+                    return verdict
+                await asyncio.wait({models_task})
+                verdict = _models_verdict(models_task, served_model_name)
+            else:
+                # Keep this as a fallback only - /health overrides it when
+                # conclusive (e.g. a dead vLLM engine still serves /v1/models)
+                verdict = _models_verdict(models_task, served_model_name)
+                await asyncio.wait({health_task})
+                health_verdict = _health_verdict(health_task)
+                if health_verdict is not None:
+                    verdict = health_verdict
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    # Mark any failure as retrieved - at most one error is
+                    # propagated from here, the other would be logged at GC
+                    task.exception()
         
-        # Phase 2: Fallback to /v1/models endpoint (lighter than chat completion)
-        # This verifies the model is registered and serving
-        try:
-            models_resp = await http_client.get(
-                f"{base_url}/v1/models",
-                headers={"Authorization": f"Bearer {api_key}"},
-                timeout=httpx.Timeout(connect=3.0, read=5.0, write=3.0, pool=5.0),
-            )
-            
-            if models_resp.status_code == 200:
-                try:
-                    data = models_resp.json()
-                    models = data.get("data", [])
-                    # Check if our model is in the list
-                    for m in models:
-                        if m.get("id") == served_model_name:
-                            return ReadinessResp(status="ready")
-                    # Model not found in list but endpoint works - might still be loading
-                    if not models:
-                        return ReadinessResp(status="loading", detail="models_list_empty")
-                except Exception:
-                    pass
-                # Models endpoint works, assume ready
-                return ReadinessResp(status="ready")
-                
-            if models_resp.status_code == 503:
-                try:
-                    j = models_resp.json()
-                    msg = (j or {}).get("error", {}).get("message", "")
-                except Exception:
-                    msg = models_resp.text[:200]
-                
-                if "Loading model" in msg or "loading" in msg.lower():
-                    return ReadinessResp(status="loading", detail="loading_model")
-                return ReadinessResp(status="loading", detail=f"503: {msg[:100]}")
-                
-        except httpx.TimeoutException:
-            return ReadinessResp(status="loading", detail="models_timeout")
-        except httpx.ConnectError:
-            return ReadinessResp(status="loading", detail="connection_refused")
-        except Exception:
-            pass
+        if verdict is not None:
+            return verdict
         
         # Phase 3: Last resort - try a minimal chat completion with longer timeout
         # Only used if health and models endpoints are inconclusive
-        request_data = {
-            "model": served_model_name,
-            "messages": [{"role": "user", "content": "Hi"}],
-            "max_tokens": 1,
-            "temperature": 0.0,
-        }
-        
-        r = await http_client.post(
-            f"{base_url}/v1/chat/completions",
-            json=request_data,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {api_key}",
-            },
-            # Increased timeout: large models (30B+) may take 10+ seconds for first token
-            timeout=httpx.Timeout(connect=5.0, read=30.0, write=5.0, pool=10.0),
+        # Timeout likely means model is still loading or very slow
+        started_ms = now_ms()
+        r, early, timed_out = await _probe(
+            lambda: _post_ready_chat(http_client, base_url, served_model_name, api_key),
+            base_url,
+            "request_timeout",
         )
+        # Only real generations and timeouts are samples: a fast 503 while
+        # loading would drag the estimate (and the next timeout) to the floor.
+        # Timeouts count so the estimate grows for models that slow down.
+        if timed_out or (r is not None and r.status_code == 200):
+            _record_latency(base_url, (now_ms() - started_ms) / 1000.0)
+        if early is not None:
+            return early
         
         if r.status_code == 200:
             return ReadinessResp(status="ready")
         
         if r.status_code == 503:
-            try:
-                j = r.json()
-                msg = (j or {}).get("error", {}).get("message", "")
-            except Exception:
-                msg = r.text[:200]
+            msg = _parse_err(r.content)
             
             if "Loading model" in msg:
                 return ReadinessResp(status="loading", detail="loading_model")
@@ -331,10 +605,5 @@ async def check_model_readiness(container_name: str, served_model_name: str, hos
         
         return ReadinessResp(status="error", detail=f"HTTP {r.status_code}")
         
-    except httpx.TimeoutException:
-        # Timeout likely means model is still loading or very slow
-        return ReadinessResp(status="loading", detail="request_timeout")
-    except httpx.ConnectError:
-        return ReadinessResp(status="loading", detail="connection_refused")
     except Exception as e:
         return ReadinessResp(status="error", detail=str(e)[:200])
@@ -0,0 +1,212 @@
+import asyncio
+import gc
+import time
+import warnings
+
+import httpx
+import pytest
+import respx
+
+from src import main
+from src.services import model_testing
+
+
+BASE_URL = "http://127.0.0.1:18000"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_state(monkeypatch):
+    for cache in (
+        model_testing._dns_cache,
+        model_testing._readiness_cache,
+        model_testing._health_method_cache,
+        model_testing._connect_fail_until,
+        model_testing._latency_ewma,
+    ):
+        cache.clear()
+    # Force the host-network URL without touching real DNS
+    async def _no_resolve(name):
+        return None
+    monkeypatch.setattr(model_testing, "_resolve_container", _no_resolve)
+
+
+def _delayed(delay: float, response: httpx.Response):
+    async def _side_effect(request):
+        await asyncio.sleep(delay)
+        return response
+    return _side_effect
+
+
+async def _check_with(health_delay: float, models_delay: float, monkeypatch):
+    with respx.mock(assert_all_called=False) as router:
+        router.head(f"{BASE_URL}/health").mock(side_effect=_delayed(
+            health_delay, httpx.Response(503, json={"detail": "engine dead"})
+        ))
+        router.get(f"{BASE_URL}/v1/models").mock(side_effect=_delayed(
+            models_delay, httpx.Response(200, json={"data": [{"id": "m"}]})
+        ))
+        async with httpx.AsyncClient() as client:
+            monkeypatch.setattr(main, "http_client", client)
+            return await model_testing.check_model_readiness("c", "m", host_port=18000)
+
+
+@pytest.mark.asyncio
+async def test_health_503_wins_when_models_answers_first(monkeypatch):
+    result = await _check_with(health_delay=0.05, models_delay=0.0, monkeypatch=monkeypatch)
+    assert result.status == "loading"
+    assert result.detail.startswith("health_503")
+
+
+@pytest.mark.asyncio
+async def test_health_503_wins_when_health_answers_first(monkeypatch):
+    result = await _check_with(health_delay=0.0, models_delay=0.05, monkeypatch=monkeypatch)
+    assert result.status == "loading"
+    assert result.detail.startswith("health_503")
+
+
+@pytest.mark.asyncio
+async def test_phase3_error_response_is_not_a_latency_sample(monkeypatch):
+    with respx.mock(assert_all_called=False) as router:
+        router.head(f"{BASE_URL}/health").mock(return_value=httpx.Response(404))
+        router.get(f"{BASE_URL}/v1/models").mock(return_value=httpx.Response(500))
+        chat = router.post(f"{BASE_URL}/v1/chat/completions")
+        async with httpx.AsyncClient() as client:
+            monkeypatch.setattr(main, "http_client", client)
+            chat.mock(return_value=httpx.Response(503, json={"error": {"message": "Loading model"}}))
+            result = await model_testing.check_model_readiness("c", "m", host_port=18000)
+            assert result.status == "loading"
+            assert BASE_URL not in model_testing._latency_ewma
+
+            model_testing._readiness_cache.clear()
+            chat.mock(return_value=httpx.Response(200, content=b"data: {}\n\n"))
+            result = await model_testing.check_model_readiness("c", "m", host_port=18000)
+            assert result.status == "ready"
+            assert BASE_URL in model_testing._latency_ewma
+
+
+@pytest.mark.asyncio
+async def test_fast_first_sample_keeps_room_for_slow_first_token(monkeypatch):
+    # Simulated 70B model: first token takes 8s, so any read timeout below
+    # that fails. The first probe answers instantly.
+    slow = {"on": False}
+
+    def _chat(request):
+        if slow["on"] and request.extensions["timeout"]["read"] < 8.0:
+            raise httpx.ReadTimeout("first token too slow", request=request)
+        return httpx.Response(200, content=b"data: {}\n\n")
+
+    with respx.mock(assert_all_called=False) as router:
+        router.head(f"{BASE_URL}/health").mock(return_value=httpx.Response(404))
+        router.get(f"{BASE_URL}/v1/models").mock(return_value=httpx.Response(500))
+        router.post(f"{BASE_URL}/v1/chat/completions").mock(side_effect=_chat)
+        async with httpx.AsyncClient() as client:
+            monkeypatch.setattr(main, "http_client", client)
+            result = await model_testing.check_model_readiness("c", "m", host_port=18000)
+            assert result.status == "ready"
+
+            model_testing._readiness_cache.clear()
+            slow["on"] = True
+            result = await model_testing.check_model_readiness("c", "m", host_port=18000)
+            assert result.status == "ready"
+
+
+@pytest.mark.asyncio
+async def test_readiness_cache_hit_and_invalidate(monkeypatch):
+    with respx.mock(assert_all_called=False) as router:
+        health = router.head(f"{BASE_URL}/health").mock(return_value=httpx.Response(200))
+        router.get(f"{BASE_URL}/v1/models").mock(return_value=httpx.Response(200, json={"data": [{"id": "m"}]}))
+        async with httpx.AsyncClient() as client:
+            monkeypatch.setattr(main, "http_client", client)
+            assert (await model_testing.check_model_readiness("c", "m", host_port=18000)).status == "ready"
+            calls = len(router.calls)
+
+            # Within the TTL: served from cache, no requests
+            assert (await model_testing.check_model_readiness("c", "m", host_port=18000)).status == "ready"
+            assert len(router.calls) == calls
+
+            model_testing.invalidate_readiness("c", "m")
+            assert (await model_testing.check_model_readiness("c", "m", host_port=18000)).status == "ready"
+            assert len(router.calls) > calls
+            assert health.call_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status, ttl", [("ready", 2.0), ("loading", 0.5), ("error", 1.0), ("stopped", 1.0)])
+async def test_readiness_cache_ttl_per_status(monkeypatch, status, ttl):
+    fresh = model_testing.ReadinessResp(status="ready", detail="probed")
+
+    async def _probe(*args):
+        return fresh
+    monkeypatch.setattr(model_testing, "_probe_readiness", _probe)
+
+    key = ("c", "m")
+    cached = model_testing.ReadinessResp(status=status, detail="cached")
+    now = time.monotonic()
+
+    model_testing._readiness_cache[key] = (now - ttl + 0.2, cached)
+    assert await model_testing.check_model_readiness("c", "m") is cached
+
+    model_testing._readiness_cache[key] = (now - ttl - 0.01, cached)
+    assert await model_testing.check_model_readiness("c", "m") is fresh
+
+
+def test_invalidate_readiness_clears_dns_entry():
+    model_testing._dns_cache["c"] = (time.monotonic(), None)
+    model_testing._readiness_cache[("c", "m")] = (time.monotonic(), model_testing.ReadinessResp(status="ready"))
+    model_testing.invalidate_readiness("c", "m")
+    assert "c" not in model_testing._dns_cache
+    assert ("c", "m") not in model_testing._readiness_cache
+
+
+@pytest.mark.asyncio
+async def test_health_head_falls_back_to_get_once(monkeypatch):
+    with respx.mock(assert_all_called=False) as router:
+        # FastAPI GET routes (vLLM) answer HEAD with 405
+        head = router.head(f"{BASE_URL}/health").mock(return_value=httpx.Response(405))
+        get = router.get(f"{BASE_URL}/health").mock(return_value=httpx.Response(200))
+        router.get(f"{BASE_URL}/v1/models").mock(return_value=httpx.Response(200, json={"data": [{"id": "m"}]}))
+        async with httpx.AsyncClient() as client:
+            monkeypatch.setattr(main, "http_client", client)
+            assert (await model_testing.check_model_readiness("c", "m", host_port=18000)).status == "ready"
+            assert (head.call_count, get.call_count) == (1, 1)
+            assert model_testing._health_method_cache[BASE_URL] == "GET"
+
+            model_testing.invalidate_readiness("c", "m")
+            assert (await model_testing.check_model_readiness("c", "m", host_port=18000)).status == "ready"
+            assert (head.call_count, get.call_count) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_connection_refused_backs_off_until_invalidated(monkeypatch):
+    with respx.mock(assert_all_called=False) as router:
+        router.route(host="127.0.0.1", port=18000).mock(side_effect=httpx.ConnectError("refused"))
+        async with httpx.AsyncClient() as client:
+            monkeypatch.setattr(main, "http_client", client)
+            result = await model_testing.check_model_readiness("c", "m", host_port=18000)
+            assert (result.status, result.detail) == ("loading", "connection_refused")
+            calls = len(router.calls)
+            assert calls > 0
+
+            # Within the backoff window: no requests, even with the result cache cleared
+            model_testing._readiness_cache.clear()
+            result = await model_testing.check_model_readiness("c", "m", host_port=18000)
+            assert (result.status, result.detail) == ("loading", "connection_refused")
+            assert len(router.calls) == calls
+
+            # A (re)start invalidates the backoff so the new container is probed
+            model_testing.invalidate_readiness("c", "m", 18000)
+            await model_testing.check_model_readiness("c", "m", host_port=18000)
+            assert len(router.calls) > calls
+
+
+@pytest.mark.asyncio
+async def test_probe_tasks_are_cleaned_up_when_client_missing(monkeypatch, caplog):
+    # Outside the app lifespan http_client is None, so building requests fails
+    monkeypatch.setattr(main, "http_client", None)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        result = await model_testing.check_model_readiness("c", "m", host_port=18000)
+        await asyncio.sleep(0)
+        gc.collect()
+    assert result.status == "error"
+    assert not [r for r in caplog.records if r.name == "asyncio"]